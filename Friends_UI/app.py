@@ -1,10 +1,7 @@
-import sys
 import os
+import time
 
-# add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from main import FriendsCLI
+from friends.main import FriendsCLI
 from flask import Flask, render_template, request, redirect
 
 import matplotlib
@@ -18,6 +15,13 @@ app = Flask(__name__)
 # Load the graph. 
 cli = FriendsCLI()
 
+# Start time of this process, so a graph.png left over from an earlier run is never reused.
+_PROCESS_START = time.time()
+# Key of the graph last rendered by generate_graph_image.
+_last_key = None
+# Node positions from earlier layouts, reused so season views don't jump around.
+_layout_cache = {}
+
 @app.route("/")
 def index():
     return render_template("index.html")
@@ -76,22 +80,42 @@ def rankings():
     return render_template("rankings.html", rankings=result)
 
 def generate_graph_image(graph, save_path="Friends_UI/static/graph.png"):
-    """Generate and save a visualization of the graph using NetworkX and Matplotlib."""
-    G = nx.Graph()
-
+    """
+    Generate and save a visualization of the graph using NetworkX and Matplotlib.
+    Skips the work if the same graph was already rendered to save_path by this process.
+    """
+    global _last_key
+    key = (frozenset(graph.nodes), sum(node.weighted_degree for node in graph.nodes.values()))
+    if (key == _last_key and os.path.exists(save_path)
+            and os.path.getmtime(save_path) >= _PROCESS_START):
+        return
+
+    # Each edge is stored on both endpoints, so keep only its first copy.
+    seen = set()
+    edges = []
     for name, node in graph.nodes.items():
-        G.add_node(name)
-
-    for name, node in graph.nodes.items():
-        for neighbor, weight in node.neighbors.items():
-            if G.has_edge(name, neighbor):
+        for neighbor, weight in zip(node.neighbor_names, node.neighbor_weights):
+            edge_key = frozenset((name, neighbor))
+            if edge_key in seen:
                 continue
-            G.add_edge(name, neighbor, weight=weight)
+            seen.add(edge_key)
+            edges.append((name, neighbor, weight))
+
+    G = nx.Graph()
+    G.add_nodes_from(graph.nodes)
+    G.add_weighted_edges_from(edges)
 
     plt.figure(figsize=(10, 8))
 
-    # Determine positions using spring layout. 
-    pos = nx.spring_layout(G, k=0.5, seed=42)  
+    # Determine positions using spring layout, keeping nodes that were laid out before in place. 
+    known = {name: _layout_cache[name] for name in G if name in _layout_cache}
+    if len(known) == len(G):
+        pos = known
+    elif known:
+        pos = nx.spring_layout(G, k=0.5, seed=42, pos=known, fixed=list(known))
+    else:
+        pos = nx.spring_layout(G, k=0.5, seed=42)
+    _layout_cache.update(pos)
 
     node_sizes = [
     min(node.weighted_degree * 20, 300) 
@@ -112,6 +136,7 @@ def generate_graph_image(graph, save_path="Friends_UI/static/graph.png"):
     plt.tight_layout()
     plt.savefig(save_path)
     plt.close()
+    _last_key = key
 
 @app.route("/graph")
 def graph_page():
@@ -0,0 +1,359 @@
+import os
+import re
+import multiprocessing as mp
+from collections import Counter, defaultdict
+from itertools import combinations
+
+# Process scripts like: **Phoebe shakes her hand and says: Phoe-Be.**
+ACTION_WORDS = {
+    "says", "shakes", "walks", "laughs", "enters", "exits",
+    "shouts", "yells", "cries", "looks", "stares", "turns",
+    "moves", "explains", "asks", "replies", "continues",
+    "tells", "answers", "runs", "steps", "smiles", "nods",
+    "starts", "storms", "coming", "starting", "raises",
+    "have", "screaming", "to", "cutting", "at", "with",
+    "opens", "looking", "has", "gets"
+}
+
+# Exclude group speakers like "all".
+GROUP_SPEAKER_PHRASES = {
+    "all", "everyone", "guys", "both",
+    "the guys", "girls", "girl", "boys", "boy",
+    "guy", "women", "woman", "men", "man"
+}
+
+# Exclude group indications like Monica's kid.
+GROUP_INDICATORS = {
+    "girls", "girl", "boys", "boy", "guys",
+    "guy", "crowd", "people", "kids", "kid", "friend",
+    "friends", "family", "parents", "neighbors",
+    "roommates", "siblings", "child", "children",
+    "women", "men", "directed", "extra", "everybody",
+    "everyone", "together", "written", "produced", 
+    "transcribed", "hosted"
+}
+
+# Exclude general roles like "customer".
+GENERIC_ROLES = {
+    "customer", "customers", "receptionist",
+    "receptionists", "nurse", "waiter", "waiters",
+    "waitress", "teacher", "clerk", "fireman",
+    "detector", "tag", "boss", "tourist", "gambler",
+    "dealer", "attendant", "croupier", "guard",
+    "lurker", "director", "cashier", "message",
+    "critic", "interviewer", "doctor", "tv", "story", 
+    "writer", "teleplay", "note"
+}
+
+# Any of these words in a speaker prefix excludes it from the normal match.
+_EXCLUDE_FROM_NORMAL = frozenset(GROUP_SPEAKER_PHRASES | GENERIC_ROLES | GROUP_INDICATORS)
+
+# Construct a dictionary for irregular abbreviation, keyed by lowercase name.
+NAME_MAP = {
+    "chan": "Chandler",
+    "rach": "Rachel",
+    "rahcel": "Rachel",
+    "mnca": "Monica",
+    "phoe": "Phoebe"
+}
+
+# Precompiled patterns used by the parsers below.
+# _LINE_RE classifies a line in one pass; dispatch on `lastgroup`:
+#   scene  - scene change, e.g. [Scene: Central Perk]
+#   normal - speaker line, e.g. Monica: blah / Mrs. Geller (to Ross): blah
+#   colon  - any other line with a colon, handled by the fallback.
+_LINE_RE = re.compile(
+    r"(?P<scene>\[(?:Scene|Time|Cut|Commercial|Closing))"
+    r"|(?P<normal>(?P<speaker>[A-Z][a-zA-Z\s.']+)(?:\s*\([^)]*\))?\s*:\s*(?P<content>.*)$)"
+    r"|(?P<colon>[^:]*):"
+)
+_AND_RE = re.compile(r"\band\b|&", re.IGNORECASE)
+# Matched against upper-cased filenames, so no IGNORECASE is needed.
+_EPI_RE = re.compile(r"S\d+E\d+(?:-S?\d*E?\d+)?")
+
+def split_multi_speaker(raw: str) -> list:
+    """
+    Split multi-speaker strings like "Joey And Chandler" into individual names.  
+
+    Parameters
+    ----------
+    raw : str
+        Raw speaker string that may contain combined names. 
+    
+    Returns
+    -------
+    list of str
+        A list of individual character names extracted from the string. 
+    """
+    raw = raw.strip().lower()
+
+    if raw in GROUP_SPEAKER_PHRASES:
+        return []
+    
+    raw_norm = _AND_RE.sub(",", raw)
+    parts = [p.strip().title() for p in raw_norm.split(",") if p.strip()]
+
+    return parts
+
+def episode_id_from_filename(file_name: str):
+    """
+    Extract the episode id from a script filename, e.g. "S02E12-S02E13".
+
+    Parameters
+    ----------
+    file_name : str
+        Filename of a single episode script (e.g. "s01e01 Monica Gets A Roommate.txt").
+
+    Returns
+    -------
+    str or None
+        The upper-cased episode id, or None if the filename does not contain one.
+    """
+    match = _EPI_RE.search(file_name.upper())
+    return match.group() if match else None
+
+def iter_script_lines(file_path):
+    """
+    Yield the stripped lines of a script file.
+
+    The whole file is read as text and split with str.splitlines, which is
+    faster for episode-sized scripts than iterating a memory map line by line.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the .txt file for a single episode.
+
+    Yields
+    ------
+    str
+        One line of the script with surrounding whitespace removed.
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        text = f.read()
+
+    for line in text.splitlines():
+        yield line.strip()
+
+def _parse(file_path, track_wordcount: bool):
+    """
+    Shared parser behind parse_episode_file and parse_episode_file_with_wordcount.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the .txt file for a single episode.
+    track_wordcount : bool
+        Whether to count how many words each character says.
+
+    Returns
+    -------
+    scenes, interactions, wordcount
+        See parse_episode_file_with_wordcount. wordcount is None when
+        track_wordcount is False.
+    """
+    scenes = []
+    current_scene = set()
+    word_count = defaultdict(int) if track_wordcount else None
+    
+    MAIN_CHARS = ["Monica", "Rachel", "Phoebe", "Ross", "Chandler", 
+                    "Joey", "Ursula", "Carol", "Susan", "Janice"
+    ]
+
+    for line in iter_script_lines(file_path):
+        if not line:
+            continue
+        
+        # Skip script information. 
+        if line.lower().startswith(("written by", "story by", "teleplay by")): # e.g. Written by: David Crane
+            continue
+        
+        # Action Direction. e.g. (They all stare, bemused.)
+        if line.startswith("("): 
+            continue
+        
+        line_match = _LINE_RE.match(line)
+        if not line_match:
+            # Neither a scene change nor a speaker line.
+            continue
+        kind = line_match.lastgroup
+
+        # Change scenes. 
+        if kind == "scene":
+            # Append the latest scene into the scenes list as a sorted tuple.
+            if current_scene:
+                scenes.append(tuple(sorted(current_scene)))
+            # Initialize a new scene set.
+            current_scene = set()
+            continue
+
+        # Normal match e.g. Monica: blah blah blah
+        # Mrs. Geller: blah blah blah
+        if kind == "normal":
+            prefix = line_match.group("speaker").strip()
+            lower_prefix = prefix.lower()
+            
+            if lower_prefix in GROUP_SPEAKER_PHRASES: # E.g. all, everyone.
+                continue
+            if lower_prefix in GENERIC_ROLES: # E.g. customer, teacher.
+                continue
+            
+            # Exclude phrases like Phoebe's Friends
+            words_no_ap = lower_prefix.replace("'", "").split()
+            if not _EXCLUDE_FROM_NORMAL.isdisjoint(words_no_ap):
+                continue
+            
+            if not ACTION_WORDS.isdisjoint(words_no_ap):
+                pass # Go to fallback. 
+            else:            
+                speakers = split_multi_speaker(prefix)
+                if track_wordcount:
+                    words = line_match.group("content").split()
+                for speaker in speakers:
+                    normalized = NAME_MAP.get(speaker.lower(), speaker)
+                    current_scene.add(normalized)
+                    if track_wordcount:
+                        word_count[normalized] += len(words)
+                continue
+        
+        # Fallback. Deal with cases like: 
+        # Phoebe shakes her hand and says: Phoe-Be. 
+        prefix, _, content = line.partition(":")
+        prefix = prefix.strip()
+        lower_prefix = prefix.lower()
+        
+        if lower_prefix in GROUP_SPEAKER_PHRASES:
+            continue
+        if lower_prefix in GENERIC_ROLES:
+            continue
+        
+        words_no_ap = lower_prefix.replace("'", "").split()
+        if not GROUP_INDICATORS.isdisjoint(words_no_ap):
+            continue
+        
+        fallback = [name for name in MAIN_CHARS if name.lower() in lower_prefix]
+        if len(fallback) == 1:
+            current_scene.add(fallback[0])
+            if track_wordcount:
+                word_count[fallback[0]] += len(content.split())
+        # Otherwise no match. Just continue.
+
+    if current_scene:
+        scenes.append(tuple(sorted(current_scene)))
+
+    interaction_counter = Counter()
+    for scene in scenes:
+        interaction_counter.update(combinations(scene, 2))
+
+    if track_wordcount:
+        word_count = dict(word_count)
+
+    return scenes, dict(interaction_counter), word_count
+
+def parse_episode_file(file_path):
+    """
+    Parse a single Friends script file to extract scene-based character interactions.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the .txt file for a single episode (e.g. "S01E01 Monica Gets A Roommate.txt")
+
+    Returns
+    -------
+    scenes : list[tuple[str, ...]]
+        List of sorted tuples, where each tuple contains all characters appearing in one scene.
+        Example: [('Chandler', 'Monica', 'Ross'), ('Monica', 'Phoebe', 'Rachel'), ...]
+
+    interactions : dict[(str, str), int]
+        Dictionary of pairwise co-occurrence counts across all scenes.
+        Example: {('Monica','Ross'): 8, ('Monica','Chandler'): 5, ...}
+    """
+    return _parse(file_path, False)[:2]
+
+def parse_episode_file_with_wordcount(file_path):
+    """
+    Enhanced parser: 
+    - Extract characters per scene
+    - Extract interaction
+    - Count how many words each character has said per episode
+
+    Returns
+    -------
+    scenes : list[tuple[str, ...]]
+        List of sorted tuples, where each tuple contains all characters appearing in one scene.
+        Example: [('Chandler', 'Monica', 'Ross'), ('Monica', 'Phoebe', 'Rachel'), ...]
+
+    interactions : dict[(str, str), int]
+        Dictionary of pairwise co-occurrence counts across all scenes.
+        Example: {('Monica','Ross'): 8, ('Monica','Chandler'): 5, ...}
+    
+    wordcount: dict[str, int]
+        Dictionary of word count for each character in each episode
+    """
+    return _parse(file_path, True)
+
+def parse_all_scripts(folder_path):
+    """
+    Batch-parse all Friends script files in a folder.
+
+    Parameters
+    ----------
+    folder_path : str
+        Path to folder containing all .txt episode files.
+
+    Returns
+    -------
+    all_edges_df : pandas.DataFrame
+        DataFrame with columns [episode_id, source, target, weight].
+        Each row represents an interaction between two characters within an episode.
+
+    episode_summary : dict[str, dict]
+        Meta info per episode: number of scenes, unique characters, total interactions.
+    """
+
+    episode_ids, sources, targets, weights = [], [], [], []
+    episode_summary = {}
+
+    # Collect (episode_id, file) pairs first so the parsing can be fanned out.
+    items = []
+    for file in sorted(os.listdir(folder_path)):
+        if not file.endswith(".txt"):
+            continue
+
+        episode_id = episode_id_from_filename(file)
+        if episode_id is None:
+            print(f"Skipping {file} (no episode id found)")
+            continue
+        items.append((episode_id, file))
+
+    # Episodes are independent, so parse them in parallel worker processes.
+    file_paths = [os.path.join(folder_path, file) for _, file in items]
+    with mp.Pool() as pool:
+        results = pool.imap(parse_episode_file, file_paths, chunksize=4)
+
+        for (episode_id, file), (scenes, interactions) in zip(items, results):
+            for (a, b), w in interactions.items():
+                episode_ids.append(episode_id)
+                sources.append(a)
+                targets.append(b)
+                weights.append(w)
+
+            episode_summary[episode_id] = {
+                "file": file,
+                "num_scenes": len(scenes),
+                "num_characters": len(set().union(*scenes)),
+                "num_edges": len(interactions)
+            }
+
+    # pandas is only needed here, so importing this module stays cheap for the CLI and UI.
+    import pandas as pd
+
+    all_edges_df = pd.DataFrame({
+        "episode_id": episode_ids,
+        "source": sources,
+        "target": targets,
+        "weight": weights
+    }, copy=False)
+    print(f"Parsed {len(episode_summary)} episodes, total {len(all_edges_df)} edges.")
+    return all_edges_df, episode_summary
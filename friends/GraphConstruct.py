@@ -1,5 +1,5 @@
 from collections import deque
-import re
+import heapq
 
 class Node:
     """
@@ -8,7 +8,9 @@ class Node:
     Attributes
     ----------
     name : str
-    neighbors : dict {neighbor_name: weight}
+    neighbor_names : list of neighbor names, in insertion order
+    neighbor_weights : list of weights, parallel to neighbor_names
+    neighbors : dict {neighbor_name: weight}, built from the two lists
     degree : int
     weighted_degree : int
     pop_scores : list
@@ -31,13 +33,28 @@ class Node:
     avg_effective_popularity()
         Calculate and return the average popularity score across all episodes this character appears effectively in. 
     """
+    __slots__ = (
+        "name", "_nbr_idx", "neighbor_names", "neighbor_weights",
+        "degree", "weighted_degree",
+        "pop_scores", "effective_pop_scores",
+        "_pop_sum", "_pop_n", "_epop_sum", "_epop_n"
+    )
+
     def __init__(self, name: str):
         self.name = name
-        self.neighbors = {}
+        # Parallel lists for fast sweeps, plus a name -> index map for updates.
+        self._nbr_idx = {}
+        self.neighbor_names = []
+        self.neighbor_weights = []
         self.degree = 0
         self.weighted_degree = 0
         self.pop_scores = []
         self.effective_pop_scores = []
+        # Running totals so the averages are O(1).
+        self._pop_sum = 0
+        self._pop_n = 0
+        self._epop_sum = 0
+        self._epop_n = 0
         
     def add_neighbor(self, neighbor: str, weight: int = 1):
         """
@@ -51,35 +68,43 @@ class Node:
         weight : int
             The number of interactions between the node and the neighbor. 
         """
-        if neighbor in self.neighbors:
-            self.neighbors[neighbor] += weight
+        i = self._nbr_idx.get(neighbor)
+        if i is not None:
+            self.neighbor_weights[i] += weight
             self.weighted_degree += weight
         else:
-            self.neighbors[neighbor] = weight
+            self._nbr_idx[neighbor] = len(self.neighbor_names)
+            self.neighbor_names.append(neighbor)
+            self.neighbor_weights.append(weight)
             self.degree += 1
             self.weighted_degree += weight
+
+    @property
+    def neighbors(self):
+        """Return a {neighbor_name: weight} dict of this node's edges."""
+        return dict(zip(self.neighbor_names, self.neighbor_weights))
     
     def add_popularity_score(self, score):
         """Add one episode-level popularity score for this character."""
         if score is not None:
             self.pop_scores.append(score)
+            self._pop_sum += score
+            self._pop_n += 1
     
     def avg_popularity(self):
         """Calculate and return the average popularity score across all episodes this character appears in."""
-        if not self.pop_scores:
-            return None
-        return sum(self.pop_scores) / len(self.pop_scores)
+        return self._pop_sum / self._pop_n if self._pop_n else None
 
     def add_effective_popularity_score(self, score):
         """Add one episode-level popularity score for this character if the character is one of the main cast in that episode."""
         if score is not None:
             self.effective_pop_scores.append(score)
+            self._epop_sum += score
+            self._epop_n += 1
     
     def avg_effective_popularity(self):
         """Calculate and return the average effective popularity score across all episodes this character appears in."""
-        if not self.effective_pop_scores:
-            return None
-        return sum(self.effective_pop_scores) / len(self.effective_pop_scores)
+        return self._epop_sum / self._epop_n if self._epop_n else None
     
     def __repr__(self):
         avg_pop = self.avg_popularity()
@@ -158,12 +183,8 @@ class Graph:
         if character not in self.nodes:
             return []
         
-        neighbors = []
-        for (neighbor, weight) in self.nodes[character].neighbors.items():
-            neighbors.append((neighbor, weight))
-        
-        neighbors.sort(key=lambda x: x[1], reverse=True)
-        return neighbors
+        node = self.nodes[character]
+        return sorted(zip(node.neighbor_names, node.neighbor_weights), key=lambda x: x[1], reverse=True)
     
     def build_graph_from_interactions(self, episode_interactions):
         """
@@ -172,11 +193,10 @@ class Graph:
         Parameters
         ----------
         episode_interactions : dict
-            episode_id: {"A-B": weight, ...}
+            episode_id: {("A", "B"): weight, ...}
         """
         for epi, interactions in episode_interactions.items():
-            for pair, weight in interactions.items():
-                a, b = pair.split("-")
+            for (a, b), weight in interactions.items():
                 self.add_edge(a, b, weight)
     
     def add_popularity_by_presence(self, episode_characters, episode_popularity):
@@ -219,27 +239,28 @@ class Graph:
     
     def top_k_by_degree(self, k=3):
         """Return top-k nodes sorted by degree."""
-        return sorted(self.nodes.values(), key=lambda n: n.degree, reverse=True)[:k]
+        return heapq.nlargest(k, self.nodes.values(), key=lambda n: n.degree)
 
     def top_k_by_weighted_degree(self, k=3):
         """Return top-k nodes sorted by sum of weights."""
-        return sorted(self.nodes.values(), key=lambda n: n.weighted_degree, reverse=True)[:k]
+        return heapq.nlargest(k, self.nodes.values(), key=lambda n: n.weighted_degree)
     
     def top_k_by_popularity(self, k=5, min_episodes = 5):
         """Return top-k nodes sorted by average popularity."""
-        candidates = [
-            n for n in self.nodes.values()
-            if len(n.pop_scores) >= min_episodes and n.avg_popularity() is not None
+        # Compute each average once rather than on every comparison.
+        scored = [
+            (n.avg_popularity(), n) for n in self.nodes.values()
+            if len(n.pop_scores) >= min_episodes and n.pop_scores
         ]
-        return sorted(candidates, key=lambda n: n.avg_popularity(), reverse=True)[:k]
+        return [n for _, n in heapq.nlargest(k, scored, key=lambda x: x[0])]
 
     def top_k_by_effective_popularity(self, k=5, min_episodes = 3):
         """Return top-k nodes sorted by average effective popularity."""
-        candidates = [
-            n for n in self.nodes.values()
-            if len(n.effective_pop_scores) >= min_episodes and n.avg_effective_popularity() is not None
+        scored = [
+            (n.avg_effective_popularity(), n) for n in self.nodes.values()
+            if len(n.effective_pop_scores) >= min_episodes and n.effective_pop_scores
         ]
-        return sorted(candidates, key=lambda n: n.avg_effective_popularity(), reverse=True)[:k]
+        return [n for _, n in heapq.nlargest(k, scored, key=lambda x: x[0])]
     
     def search_character(self, character: str, top_k:int = 5):
         """
@@ -289,51 +310,103 @@ class Graph:
         if start not in self.nodes or end not in self.nodes:
             return None
         
-        queue = deque([(start, [start])])
-        visited = set([start])
+        # Record each node's predecessor instead of copying a path per enqueue.
+        queue = deque([start])
+        parent = {start: None}
 
         while queue:
-            curr, path = queue.popleft()
+            curr = queue.popleft()
             if curr == end:
+                path = []
+                while curr is not None:
+                    path.append(curr)
+                    curr = parent[curr]
+                path.reverse()
                 return path
             
-            for neighbor in self.nodes[curr].neighbors:
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, path + [neighbor]))
+            for neighbor in self.nodes[curr].neighbor_names:
+                if neighbor not in parent:
+                    parent[neighbor] = curr
+                    queue.append(neighbor)
 
         return None
 
-def build_graph_by_seasons(episode_interactions, seasons) -> Graph:
+def episode_season(episode_id: str):
+    """
+    Read the season number from an episode id such as "S01E01" or "S1E01".
+
+    Parameters
+    ----------
+    episode_id: str
+        Episode id starting with "S<season>E".
+
+    Returns
+    -------
+    int or None
+        The season number, or None if the id does not start with one.
+    """
+    end = episode_id.find("E", 1)
+    if episode_id[:1] != "S" or end == -1:
+        return None
+    digits = episode_id[1:end]
+    return int(digits) if digits.isdigit() else None
+
+def index_episodes_by_season(episode_ids) -> dict:
+    """
+    Group episode ids by season number, e.g. {1: ["S01E01", "S01E02", ...], ...}.
+    The season is read with episode_season; ids without one are left out.
+
+    Parameters
+    ----------
+    episode_ids: iterable of str
+        Episode ids such as "S01E01".
+
+    Returns
+    -------
+    dict[int, list[str]]
+        Season number to the episode ids of that season, in input order.
+    """
+    season_to_episodes = {}
+    for episode_id in episode_ids:
+        season = episode_season(episode_id)
+        if season is None:
+            continue
+        season_to_episodes.setdefault(season, []).append(episode_id)
+    return season_to_episodes
+
+def build_graph_by_seasons(episode_interactions, seasons, season_to_episodes=None) -> Graph:
     """
     Build a Graph containing only edges from the specified seasons. 
     
     Parameters
     ----------
     episode_interaction: dict
-        episode_id: {"A-B": weight, ...}
+        episode_id: {("A", "B"): weight, ...}
     
     seasons: list[int]
-        List of season numbers
+        List of season numbers. Repeated seasons are only added once.
+
+    season_to_episodes: dict[int, list[str]], optional
+        Index from index_episodes_by_season. Built from episode_interactions if not given. 
     
     Returns
     -------
     Graph
         A new graph containing only edges from the specified seasons. 
     """
+    if season_to_episodes is None:
+        season_to_episodes = index_episodes_by_season(episode_interactions)
+
     g = Graph()
     
-    for episode_id, interaction_dict in episode_interactions.items():
-        match = re.search(r"S(\d+)E", episode_id)
-        if not match: 
-            continue
-        
-        season_num = int(match.group(1))
-        if season_num not in seasons:
-            continue
-        
-        for pair, weight in interaction_dict.items():
-            a, b = pair.split("-")
-            g.add_edge(a, b, weight)
+    # Walk each season once and in ascending order, so edges are added in episode order.
+    for season_num in sorted(set(seasons)):
+        for episode_id in season_to_episodes.get(season_num, ()):
+            interaction_dict = episode_interactions.get(episode_id)
+            if interaction_dict is None:
+                continue
+            
+            for (a, b), weight in interaction_dict.items():
+                g.add_edge(a, b, weight)
     
-    return g
\ No newline at end of file
+    return g
@@ -0,0 +1,189 @@
+import os
+import csv
+import sys
+import json
+import multiprocessing as mp
+from friends.DataProcessing import episode_id_from_filename, parse_episode_file_with_wordcount
+
+# orjson is optional; it is much faster than the stdlib json module for the cache files.
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+def save_parsed_data_as_json(scripts_folder, output_folder):
+    """
+    Batch-parse all Friends script files in scripts_folder,
+    and save the structured data as JSON into output_folder.
+
+    Output JSON files:
+        - episode_scenes.json
+        - episode_interactions.json
+        - episode_characters.json
+        - episode_meta.json (column-wise: {"ids": [...], "files": [...], "num_scenes": [...], ...})
+    """
+
+    if not os.path.exists(output_folder):
+        os.makedirs(output_folder)
+
+    # Collect all .txt scripts
+    with os.scandir(scripts_folder) as it:
+        script_files = sorted(e.name for e in it if e.is_file() and e.name.endswith(".txt"))
+
+    # Extract episode_id from each filename (e.g., S02E12-S02E13)
+    episode_files = {}  # episode_id -> file
+    for file in script_files:
+        episode_id = episode_id_from_filename(file)
+        if episode_id is None:
+            print(f"Skipping file (no episode id found): {file}")
+            continue
+        # Keep one file per episode_id, so every output (meta included) describes the same file.
+        if episode_id in episode_files:
+            print(f"Duplicate episode id {episode_id}: using {file} instead of {episode_files[episode_id]}")
+        episode_files[episode_id] = file
+    jobs = list(episode_files.items())
+
+    # Every episode_id is known now, so create the four output dicts with all their keys.
+    # dict.fromkeys sizes the new table up front when given a dict, so none of them
+    # has to grow (and rehash) while the results are merged in.
+    episode_scenes = dict.fromkeys(episode_files)          # episode_id -> list of scenes (each scene is a list)
+    episode_interactions = dict.fromkeys(episode_files)    # episode_id -> { "A-B": weight }
+    episode_characters = dict.fromkeys(episode_files)      # episode_id -> list of unique characters
+    episode_wordcount = dict.fromkeys(episode_files)
+
+    # Metadata is kept column-wise: one list per field, aligned by position.
+    meta_ids, meta_files, meta_scenes, meta_chars, meta_edges = [], [], [], [], []
+
+    # Parse the episodes in worker processes; each script is independent.
+    scripts_base = scripts_folder.rstrip(os.sep) + os.sep
+    file_paths = [scripts_base + file for _, file in jobs]
+    with mp.Pool() as pool:
+        results = pool.imap(parse_episode_file_with_wordcount, file_paths, chunksize=8)
+
+        for (episode_id, file), (scenes, interactions, word_count) in zip(jobs, results):
+            # Prepare structures (scenes are already sorted tuples)
+            episode_scenes[episode_id] = [list(scene) for scene in scenes]
+
+            # Convert (A,B) tuples → "A-B" JSON-friendly keys
+            episode_interactions[episode_id] = {a + "-" + b: w for (a, b), w in interactions.items()}
+
+            # characters list (union of all scenes)
+            char_set = set().union(*scenes)
+            episode_characters[episode_id] = sorted(char_set)
+
+            # WordCount for each character per episode. 
+            episode_wordcount[episode_id] = word_count
+
+            # meta info
+            meta_ids.append(episode_id)
+            meta_files.append(file)
+            meta_scenes.append(len(scenes))
+            meta_chars.append(len(char_set))
+            meta_edges.append(len(interactions))
+
+            print(f"Parsed {episode_id}  | scenes: {len(scenes)}, chars: {len(char_set)}, edges: {len(interactions)}")
+
+    episode_meta = {
+        "ids": meta_ids,
+        "files": meta_files,
+        "num_scenes": meta_scenes,
+        "num_characters": meta_chars,
+        "num_edges": meta_edges
+    }
+
+    output_base = output_folder.rstrip(os.sep) + os.sep
+
+    def save_json(data, name, count=None):
+        dump_json(data, output_base + name)
+        print(f"Saved {name} ({len(data) if count is None else count} items)")
+    
+    save_json(episode_scenes, "episode_scenes.json")
+    save_json(episode_interactions, "episode_interactions.json")
+    save_json(episode_characters, "episode_characters.json")
+    save_json(episode_meta, "episode_meta.json", len(meta_ids))
+    save_json(episode_wordcount, "episode_wordcount.json")
+
+    print("\nAll JSON cache files generated successfully!")
+
+
+def build_and_save_episode_popularity(csv_path, output_json_path):
+    """
+    Read the Friends episode score CSV, build an episode_popularity dict,
+    and save it to a JSON file.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to friends_episodes_scores.csv.
+    output_json_path : str
+        JSON file path to save the episode_id → Stars mapping.
+
+    Returns
+    -------
+    dict
+        The generated episode_popularity dictionary.
+    """
+
+    # Load CSV, keying each row by an episode_id like "S01E03"
+    with open(csv_path, encoding='iso-8859-1', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        season_col = header.index("Season")
+        episode_col = header.index("Episode Number")
+        stars_col = header.index("Stars")
+        episode_popularity = {
+            f"S{int(row[season_col]):02d}E{int(row[episode_col]):02d}": float(row[stars_col])
+            for row in reader
+        }
+
+    # Save JSON
+    dump_json(episode_popularity, output_json_path)
+
+    print(f"Saved episode popularity JSON to {output_json_path}")
+
+
+def dump_json(data, path):
+    """
+    Save a Python object as a compact JSON file, using orjson if it is installed.
+    The cache files are only read back by load_json, so they are not indented.
+    """
+    if _HAS_ORJSON:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"), ensure_ascii=False)
+
+
+def load_json(path):
+    """Load a JSON file and return its Python object, using orjson if it is installed. """
+    if _HAS_ORJSON:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding = "utf-8") as f:
+        return json.load(f)
+
+
+def load_interactions_json(path):
+    """
+    Load episode_interactions.json and turn its "A-B" keys back into (A, B) tuples,
+    so the pairs are split once here rather than on every graph build.
+    The names are interned, so each character is one string object across all episodes.
+    """
+    return {
+        episode_id: {
+            tuple(sys.intern(name) for name in pair.split("-")): weight
+            for pair, weight in interactions.items()
+        }
+        for episode_id, interactions in load_json(path).items()
+    }
+
+
+if __name__ == "__main__":
+    scripts_folder = "./Scripts"
+    output_folder = "./Friends_json"
+    save_parsed_data_as_json(scripts_folder, output_folder)
+    csv_path = "./data/friends_episodes_scores.csv"
+    output_json_path = os.path.join(output_folder, "episode_popularity.json")
+    build_and_save_episode_popularity(csv_path, output_json_path)
\ No newline at end of file
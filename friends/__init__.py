@@ -0,0 +1 @@
+"""The Network of Friends: character interaction graph built from Friends scripts."""
@@ -1,7 +1,7 @@
 import os
-import re
-from GraphConstruct import Graph, build_graph_by_seasons
-from JSONProcessing import load_json
+import sys
+from friends.GraphConstruct import Graph, build_graph_by_seasons, episode_season, index_episodes_by_season
+from friends.JSONProcessing import load_json, load_interactions_json
 
 class FriendsCLI:
     """
@@ -14,10 +14,14 @@ class FriendsCLI:
         full_graph (Graph): The complete graph of all characters and interactions.
         graph (Graph): The current graph, which may be filtered by seasons.
         current_seasons (str or list): Description of the current seasons represented in the graph.
+        season_to_episodes (dict): Season number to its episode ids, built once when the data is loaded.
     
     Methods:
-        _load_full_graph(): 
-            Loads the full graph from JSON files.
+        _load_raw_json():
+            Loads the episode data from JSON files.
+
+        _load_full_graph(episode_interactions, episode_characters, episode_wordcount, episode_popularity): 
+            Builds the full graph from the loaded episode data.
         
         filter_season(seasons):
             Filters the graph to only include data from specified seasons.
@@ -43,8 +47,8 @@ class FriendsCLI:
         print_interactions_commands():
             Prints the available interaction commands as a manual page.
         
-        match_commands(command):
-            Parses and executes a given command string.
+        match_commands(parts):
+            Parses and executes a given command, already split into words.
 
         reset_graph():
             Resets the current graph to the full graph. In other words, removes any season filters.
@@ -57,16 +61,39 @@ class FriendsCLI:
         self.full_graph = None
         self.graph = None
         self.current_seasons = "All 10 seasons"
-        self._load_full_graph()
+        # Graphs already built, keyed by the frozenset of their season numbers.
+        self._graph_cache = {}
+        # Raw episode data, loaded once and shared by the full graph and season filters.
+        (self._episode_interactions, self._episode_characters,
+         self._episode_wordcount, self._episode_popularity) = self._load_raw_json()
+        self.season_to_episodes = index_episodes_by_season(self._episode_interactions)
+        self._load_full_graph(
+            self._episode_interactions, self._episode_characters,
+            self._episode_wordcount, self._episode_popularity
+        )
     
-    def _load_full_graph(self):
-        """Load the full graph from JSON files."""
+    def _load_raw_json(self):
+        """Load the episode interactions, characters, word counts and popularity from JSON files."""
         print("Loading JSON data...")
-        episode_interactions = load_json(os.path.join(self.json_folder, "episode_interactions.json"))
+        episode_interactions = load_interactions_json(os.path.join(self.json_folder, "episode_interactions.json"))
         episode_characters = load_json(os.path.join(self.json_folder, "episode_characters.json"))
         episode_wordcount = load_json(os.path.join(self.json_folder, "episode_wordcount.json"))
         episode_popularity = load_json(os.path.join(self.json_folder, "episode_popularity.json"))
 
+        # Intern character names so the same name is one shared string everywhere.
+        episode_characters = {
+            epi: [sys.intern(name) for name in chars]
+            for epi, chars in episode_characters.items()
+        }
+        episode_wordcount = {
+            epi: {sys.intern(name): count for name, count in wc_dict.items()}
+            for epi, wc_dict in episode_wordcount.items()
+        }
+
+        return episode_interactions, episode_characters, episode_wordcount, episode_popularity
+
+    def _load_full_graph(self, episode_interactions, episode_characters, episode_wordcount, episode_popularity):
+        """Build the full graph from the loaded episode data."""
         # Build a new graph. 
         print("Building graph...")
         g = Graph()
@@ -89,41 +116,36 @@ class FriendsCLI:
         if isinstance(seasons, int):
             seasons = [seasons]
 
+        key = frozenset(seasons)
+        if key in self._graph_cache:
+            self.graph = self._graph_cache[key]
+            self.current_seasons = seasons
+            print(f"Season graph loaded! Characters: {len(self.graph.nodes)}\n")
+            return
+
         print(f"Building graph for seasons {seasons}...")
 
-        # Load JSON again
-        episode_interactions = load_json(f"{self.json_folder}/episode_interactions.json")
-        episode_characters = load_json(f"{self.json_folder}/episode_characters.json")
-        episode_popularity = load_json(f"{self.json_folder}/episode_popularity.json")
-        try:
-            episode_wordcount = load_json(f"{self.json_folder}/episode_wordcount.json")
-        except:
-            episode_wordcount = {}
-        
+        season_set = set(seasons)
+
         def filter_by_season(d):
-            new_d = {}
-            for epi, value in d.items():
-                match = re.search(r"S(\d+)E", epi)
-                if not match:
-                    continue
-                season_num = int(match.group(1))
-                if season_num in seasons:
-                    new_d[epi] = value
-            return new_d
-
-        episode_interactions = filter_by_season(episode_interactions)
-        episode_characters = filter_by_season(episode_characters)
-        episode_popularity = filter_by_season(episode_popularity)
-        episode_wordcount = filter_by_season(episode_wordcount)
+            # Same season rule as season_to_episodes, so both paths see the same episodes.
+            return {epi: value for epi, value in d.items() if episode_season(epi) in season_set}
+
+        # Filter the data loaded once in _load_raw_json. The interactions are not
+        # filtered: build_graph_by_seasons only visits the requested seasons already.
+        episode_characters = filter_by_season(self._episode_characters)
+        episode_popularity = filter_by_season(self._episode_popularity)
+        episode_wordcount = filter_by_season(self._episode_wordcount)
 
         # Use your build_graph_by_seasons
-        g = build_graph_by_seasons(episode_interactions, seasons)
+        g = build_graph_by_seasons(self._episode_interactions, seasons, self.season_to_episodes)
 
         # Add popularity fields
         g.add_popularity_by_presence(episode_characters, episode_popularity)
         if episode_wordcount:
             g.add_popularity_by_wordcount(episode_wordcount, episode_popularity)
 
+        self._graph_cache[key] = g
         self.graph = g
         self.current_seasons = seasons
         print(f"Season graph built! Characters: {len(self.graph.nodes)}\n")
@@ -203,34 +225,33 @@ Please enter the interaction command!
 E.g. Search Monica / 1 Monica
         """)
     
-    def match_commands(self, command):
-        """Parse and execute a given command string."""
-        command = command.split()
-        interaction = command[0]
-
-        if (interaction == "search" or interaction == "1") and len(command) >= 2:
-            self.search_character(command[1])
-        elif (interaction == "path" or interaction == "2") and len(command) >= 3:
-            self.shortest_path(command[1], command[2])
+    def match_commands(self, parts):
+        """Parse and execute a given command, already split into words."""
+        interaction = parts[0].lower()
+
+        if (interaction == "search" or interaction == "1") and len(parts) >= 2:
+            self.search_character(parts[1])
+        elif (interaction == "path" or interaction == "2") and len(parts) >= 3:
+            self.shortest_path(parts[1], parts[2])
         elif interaction == "top_degree" or interaction == "3":
-            k = int(command[1]) if len(command) >= 2 else 5
+            k = int(parts[1]) if len(parts) >= 2 else 5
             self.top_degree(k)
         elif interaction == "top_weighted_degree" or interaction == "4":
-            k = int(command[1]) if len(command) >= 2 else 5
+            k = int(parts[1]) if len(parts) >= 2 else 5
             self.top_weighted_degree(k)
         elif interaction == "popularity" or interaction == "5":
-            k = int(command[1]) if len(command) >= 2 else 5
+            k = int(parts[1]) if len(parts) >= 2 else 5
             self.top_popularity(k)
         elif interaction == "effective_popularity" or interaction == "6":
-            k = int(command[1]) if len(command) >= 2 else 5
+            k = int(parts[1]) if len(parts) >= 2 else 5
             self.top_effective_popularity(k)
         elif interaction == "season" or interaction == "7":
-            if len(command) == 2:
-                if command[1] == "all":
+            if len(parts) == 2:
+                if parts[1].lower() == "all":
                     self.reset_graph()
                 else:
                     try:
-                        season_num = int(command[1])
+                        season_num = int(parts[1])
                         self.filter_season(season_num)
                     except ValueError:
                         print("Invalid season number.")
@@ -252,16 +273,25 @@ E.g. Search Monica / 1 Monica
         print("Type 'Exit' or 'Q' for exiting the program.\n")
 
         while True:
-            command = input(">>").strip().lower()
-            if command == "exit" or command == 'q' or command == "9":
+            # Split once and lowercase only the command word; arguments keep their case.
+            parts = input(">>").split()
+            if not parts:
+                continue
+            verb = parts[0].lower()
+            if verb == "exit" or verb == 'q' or verb == "9":
                 print("Bye!")
                 break
-            elif command == "manual" or command == "8":
+            elif verb == "manual" or verb == "8":
                 self.print_interactions_commands()
             else:
-                self.match_commands(command)
+                self.match_commands(parts)
 
 
-if __name__ == "__main__":
+def main():
+    """Entry point for the `friends` console script."""
     cli = FriendsCLI()
     cli.run()
+
+
+if __name__ == "__main__":
+    main()